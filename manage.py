@@ -1,199 +1,266 @@
-import argparse
-from views import NoteManager
-
-if __name__ == "__main__":
-    user = NoteManager()
-    parser = argparse.ArgumentParser(
-        prog="Note Manager CLI App",
-        usage="[-c | -create] [-r | -read] [-u | -upd] [-d | -del] [-f | -find] [-s | - show] [-clear]",
-        description="This app can help you create and manage your notes via next options",
-        epilog="""
-Enjoy the Note Manager experience ❤ ❤ ❤ !
-You can see more information and examples in 'README.md' or GitHub:
-https://github.com/howmuchisthe-fish/Note-Manager.git
-Note Manager ver.1.0.1
-Created by Aleksander Zizevskikh, 2024
-Email: zizevskikh.dev@gmail.com""",
-        formatter_class=argparse.RawTextHelpFormatter
-    )
-
-    # Commands
-    parser.add_argument(
-        "-c",
-        "-create",
-        "--create_note",
-        action="store_true",
-        help="""Create the note in the database by following additional arguments:
-[--cat] Add the number of transaction category to the new note:
-    --cat 1 = "waste"
-    --cat 2 = "income"
-[--amt] Add a positive amount of money to the new note
-        
-Optional argument:
-[--desc] Add a description to the new note""",
-    )
-    parser.add_argument(
-        "-r",
-        "-read",
-        "--read_notes",
-        action="store_true",
-        help="""Show note(-s) from the database:
-Doesn't require any additional arguments""",
-    )
-    parser.add_argument(
-        "-u",
-        "-upd",
-        "--update_note",
-        action="store_true",
-        help="""Update the note from the database by following additional arguments:
-[--date] Add the previous date to the note you want to update
-[--cat] Add the previous number of transaction category to the note you want to update:
-    --cat 1 = "waste"
-    --cat 2 = "income"
-[--amt] Add the previous positive amount of money to the note you want to update
-[--decs] Add the previous description to the note you want to update ***
-    *** Skip this argument if an updated note doesn't have any description!
-[--newcat] Add a new number of transaction category to the note you want to update:
-    --newcat 1 = "waste"
-    --newcat 2 = "income"
-[--newamt] Add a new positive amount of money to the note you want to update
-        
-Optional argument:
-[--newdesc] Add a new description to the note you want to update""",
-    )
-    parser.add_argument(
-        "-d",
-        "-del",
-        "--delete_note",
-        action="store_true",
-        help="""Delete the note from the database by following additional arguments:
-[--date] Add a date to the note you want to delete
-[--cat] Add a number of transaction category to the note you want to delete:
-    --cat 1 = "waste"
-    --cat 2 = "income"
-[--amt] Add a positive amount of money to the note you want to delete
-[--desc] Add a description to the note you want to delete ***
-    *** Skip this argument if the deleted note doesn't have any description!""",
-    )
-    parser.add_argument(
-        "-f",
-        "-find",
-        "--find_notes",
-        action="store_true",
-        help="""Find a note(-s) from the database by following additional arguments:
-[--date] Add a date to the note(-s) you want to find
-[--cat] Add a number of transaction category to the note(-s) you want to find:
-    --cat 1 = "waste"
-    --cat 2 = "income"
-[--amt] Add a positive amount of money to the note(-s) you want to find
-
-*** Searching by [--desc] can be included into the next version of this app 🤙""",
-    )
-    parser.add_argument(
-        "-s",
-        "-show",
-        "--show_balance",
-        action="store_true",
-        help="""Show your current balance
-Doesn't require any additional argument""",
-    )
-    parser.add_argument(
-        "-clear",
-        "--clear_notes",
-        action="store_true",
-        help="""Clear all notes from the database
-Doesn't require any additional argument""",
-    )
-
-    # Arguments
-    group_args = parser.add_argument_group("Arguments")
-    group_args.add_argument(
-        "--date",
-        type=str,
-        help="""Note date, format:
-    --date yyyy-mm-dd
-Like:
-    --date 1943-04-19""",
-    )
-    group_args.add_argument(
-        "--cat",
-        choices=["1", "2"],
-        help="""Note transaction category 
-There are only 2 options:
-    --cat 1 (for "waste")
-    --cat 2 (for "income")""",
-    )
-    group_args.add_argument(
-        "--amt",
-        type=float,
-        help="""Note amount of money [positive int|float]
-Like:
-    --amt 42""",
-    )
-    group_args.add_argument(
-        "--desc",
-        default="",
-        nargs="+",
-        help="""Note description
-Like:
-    --desc Spice must flow""",
-    )
-    group_args.add_argument(
-        "--newcat",
-        choices=["1", "2"],
-        help="""New note transaction category (only for the update)
-There are only 2 options:
-    --newcat 1 (for "waste")
-    --newcat 2 (for "income")""",
-    )
-    group_args.add_argument(
-        "--newamt",
-        type=float,
-        help="""New note amount of money (only for the update) [positive int|float]
-Like:
-    --newamt 34.69""",
-    )
-    group_args.add_argument(
-        "--newdesc",
-        default="",
-        nargs="+",
-        help="""New note description (only for the update)
-Like:
-    --newdesc Beautiful is better than ugly""",
-    )
-
-    args = parser.parse_args()
-
-    if args.create_note:
-        user.create_note(cat=args.cat, amt=args.amt, desc=args.desc)
-
-    if args.read_notes:
-        user.read_notes()
-
-    if args.update_note:
-        user.update_note(
-            date_prev=args.date,
-            cat_prev=args.cat,
-            amt_prev=args.amt,
-            desc_prev=args.desc,
-            cat_new=args.newcat,
-            amt_new=args.newamt,
-            desc_new=args.newdesc,
-        )
-
-    if args.delete_note:
-        user.delete_note(
-            date=args.date,
-            cat=args.cat,
-            amt=args.amt,
-            desc=args.desc,
-        )
-
-    if args.find_notes:
-        user.find_notes(date=args.date, cat=args.cat, amt=args.amt)
-
-    if args.show_balance:
-        user.show_balance()
-
-    if args.clear_notes:
-        user.clear_notes()
+import argparse
+import shlex
+import sys
+from views import NoteManager
+
+# The commands which don't take any additional arguments can skip
+# the whole parser build and dispatch straight to the method.
+FAST_COMMANDS = {
+    "-r": "read_notes",
+    "-read": "read_notes",
+    "-s": "show_balance",
+    "-show": "show_balance",
+    "-clear": "clear_notes",
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="Note Manager CLI App",
+        usage="[-c | -create] [-r | -read] [-u | -upd] [-d | -del] [-f | -find] [-s | - show] [-clear] [-sync] [-batch]",
+        description="This app can help you create and manage your notes via next options",
+        epilog="""
+Enjoy the Note Manager experience ❤ ❤ ❤ !
+You can see more information and examples in 'README.md' or GitHub:
+https://github.com/howmuchisthe-fish/Note-Manager.git
+Note Manager ver.1.0.2
+Created by Aleksander Zizevskikh, 2024
+Email: zizevskikh.dev@gmail.com""",
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+
+    # Commands
+    parser.add_argument(
+        "-c",
+        "-create",
+        "--create_note",
+        action="store_true",
+        help="""Create the note in the database by following additional arguments:
+[--cat] Add the number of transaction category to the new note:
+    --cat 1 = "waste"
+    --cat 2 = "income"
+[--amt] Add a positive amount of money to the new note
+
+Optional argument:
+[--desc] Add a description to the new note""",
+    )
+    parser.add_argument(
+        "-r",
+        "-read",
+        "--read_notes",
+        action="store_true",
+        help="""Show note(-s) from the database:
+Doesn't require any additional arguments""",
+    )
+    parser.add_argument(
+        "-u",
+        "-upd",
+        "--update_note",
+        action="store_true",
+        help="""Update the note from the database by following additional arguments:
+[--date] Add the previous date to the note you want to update
+[--cat] Add the previous number of transaction category to the note you want to update:
+    --cat 1 = "waste"
+    --cat 2 = "income"
+[--amt] Add the previous positive amount of money to the note you want to update
+[--decs] Add the previous description to the note you want to update ***
+    *** Skip this argument if an updated note doesn't have any description!
+[--newcat] Add a new number of transaction category to the note you want to update:
+    --newcat 1 = "waste"
+    --newcat 2 = "income"
+[--newamt] Add a new positive amount of money to the note you want to update
+
+Optional argument:
+[--newdesc] Add a new description to the note you want to update""",
+    )
+    parser.add_argument(
+        "-d",
+        "-del",
+        "--delete_note",
+        action="store_true",
+        help="""Delete the note from the database by following additional arguments:
+[--date] Add a date to the note you want to delete
+[--cat] Add a number of transaction category to the note you want to delete:
+    --cat 1 = "waste"
+    --cat 2 = "income"
+[--amt] Add a positive amount of money to the note you want to delete
+[--desc] Add a description to the note you want to delete ***
+    *** Skip this argument if the deleted note doesn't have any description!""",
+    )
+    parser.add_argument(
+        "-f",
+        "-find",
+        "--find_notes",
+        action="store_true",
+        help="""Find a note(-s) from the database by following additional arguments:
+[--date] Add a date to the note(-s) you want to find
+[--cat] Add a number of transaction category to the note(-s) you want to find:
+    --cat 1 = "waste"
+    --cat 2 = "income"
+[--amt] Add a positive amount of money to the note(-s) you want to find
+
+*** Searching by [--desc] can be included into the next version of this app 🤙""",
+    )
+    parser.add_argument(
+        "-s",
+        "-show",
+        "--show_balance",
+        action="store_true",
+        help="""Show your current balance
+Doesn't require any additional argument""",
+    )
+    parser.add_argument(
+        "-clear",
+        "--clear_notes",
+        action="store_true",
+        help="""Clear all notes from the database
+Doesn't require any additional argument""",
+    )
+    parser.add_argument(
+        "-sync",
+        "--sync_text",
+        action="store_true",
+        help="""Create or update the text file 'db.txt' with all notes from the database
+Can be combined with any other command
+Doesn't require any additional argument""",
+    )
+    parser.add_argument(
+        "-batch",
+        "--batch_mode",
+        action="store_true",
+        help="""Read the commands line by line from stdin and run them in one process
+The file writes are batched and flushed at the end of the batch
+Doesn't require any additional argument""",
+    )
+
+    # Arguments
+    group_args = parser.add_argument_group("Arguments")
+    group_args.add_argument(
+        "--date",
+        type=str,
+        help="""Note date, format:
+    --date yyyy-mm-dd
+Like:
+    --date 1943-04-19""",
+    )
+    group_args.add_argument(
+        "--cat",
+        choices=["1", "2"],
+        help="""Note transaction category
+There are only 2 options:
+    --cat 1 (for "waste")
+    --cat 2 (for "income")""",
+    )
+    group_args.add_argument(
+        "--amt",
+        type=float,
+        help="""Note amount of money [positive int|float]
+Like:
+    --amt 42""",
+    )
+    group_args.add_argument(
+        "--desc",
+        default="",
+        nargs="+",
+        help="""Note description
+Like:
+    --desc Spice must flow""",
+    )
+    group_args.add_argument(
+        "--newcat",
+        choices=["1", "2"],
+        help="""New note transaction category (only for the update)
+There are only 2 options:
+    --newcat 1 (for "waste")
+    --newcat 2 (for "income")""",
+    )
+    group_args.add_argument(
+        "--newamt",
+        type=float,
+        help="""New note amount of money (only for the update) [positive int|float]
+Like:
+    --newamt 34.69""",
+    )
+    group_args.add_argument(
+        "--newdesc",
+        default="",
+        nargs="+",
+        help="""New note description (only for the update)
+Like:
+    --newdesc Beautiful is better than ugly""",
+    )
+
+    return parser
+
+
+def run_command(user: NoteManager, args: argparse.Namespace) -> None:
+    if args.create_note:
+        user.create_note(cat=args.cat, amt=args.amt, desc=args.desc)
+
+    if args.read_notes:
+        user.read_notes()
+
+    if args.update_note:
+        user.update_note(
+            date_prev=args.date,
+            cat_prev=args.cat,
+            amt_prev=args.amt,
+            desc_prev=args.desc,
+            cat_new=args.newcat,
+            amt_new=args.newamt,
+            desc_new=args.newdesc,
+        )
+
+    if args.delete_note:
+        user.delete_note(
+            date=args.date,
+            cat=args.cat,
+            amt=args.amt,
+            desc=args.desc,
+        )
+
+    if args.find_notes:
+        user.find_notes(date=args.date, cat=args.cat, amt=args.amt)
+
+    if args.show_balance:
+        user.show_balance()
+
+    if args.clear_notes:
+        user.clear_notes()
+
+    if args.sync_text:
+        user.sync_text_document()
+
+
+def run_batch_mode(parser: argparse.ArgumentParser) -> None:
+    user = NoteManager(autoflush=False)
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            args = parser.parse_args(shlex.split(line))
+        except ValueError as error:
+            print(error, end="\n\n")
+            continue
+        except SystemExit:
+            continue
+
+        run_command(user=user, args=args)
+
+
+if __name__ == "__main__":
+    fast_command = FAST_COMMANDS.get(sys.argv[1]) if len(sys.argv) == 2 else None
+
+    if fast_command:
+        getattr(NoteManager(), fast_command)()
+    else:
+        parser = build_parser()
+        args = parser.parse_args()
+
+        if args.batch_mode:
+            run_batch_mode(parser=parser)
+        else:
+            run_command(user=NoteManager(), args=args)
@@ -1,542 +1,857 @@
-import datetime
-import json
-import os
-from typing import Union, Literal
-
-
-class NoteManager:
-    """
-    View for the CLI Note Manager.
-    Provide CRUD commands, and several addition functions:
-        - Find the record(-s) from the database by the parameters;
-        - Display current amount of money;
-        - Delete all the records from the database;
-        - Create automatically a text file 'db.txt' with all records from the database, when you:
-            * create record;
-            * update record;
-            * delete record.
-    """
-
-    def __init__(self):
-        self.__balance = self.get_current_balance()
-
-    def create_note(
-            self,
-            cat: Literal["1", "2"],
-            amt: float,
-            desc: Union[list, Literal[""]]
-    ) -> None:
-        """
-        Create a new record in the database.
-        Display a new record.
-
-        :param cat: Record transaction category
-        :param amt: Record amount of money
-        :param desc: Record description, defaults to ""
-        """
-
-        if not cat or not amt:
-            print("You need to add all the required arguments to create a note", end="\n\n")
-            return
-
-        if amt < 0:
-            print("The amount of money must be a positive number", end="\n\n")
-            return
-
-        db_data, notes_amt = self.get_db_data_and_notes_amt()
-        cat, amt, desc = self.prepare_cat_amt_desc(cat=cat, amt=amt, desc=desc)
-        note_new = self.create_note_template(cat=cat, amt=amt, desc=desc)
-        db_data["notes"].append(note_new)
-        self.update_db(db_data=db_data)
-
-        print("The new note has been created!", end="\n\n")
-        print("-" * 40)
-        print("Created note:")
-        print("-" * 40)
-        self.print_notes(notes_lst=[note_new])
-
-        if notes_amt == 0:
-            self.create_or_update_text_document(action_text="create")
-        else:
-            self.create_or_update_text_document()
-
-    def read_notes(self) -> None:
-        """Display all the records from the database."""
-
-        db_data, notes_amt = self.get_db_data_and_notes_amt()
-
-        if notes_amt > 0:
-            print("-" * 40)
-            print(f"Database contains {notes_amt} note(-s):")
-            print("-" * 40, end="\n\n")
-            self.print_notes(notes_lst=db_data["notes"])
-        else:
-            print("Can't show all notes because of the empty database", end="\n\n")
-
-    def update_note(
-            self,
-            date_prev: str,
-            cat_prev: Literal["1", "2"],
-            amt_prev: float,
-            desc_prev: Union[list, Literal[""]],
-            cat_new: Literal["1", "2"],
-            amt_new: float,
-            desc_new: Union[list, Literal[""]]
-    ) -> None:
-        """
-        Update an existing record with the new one and write it into the database.
-        Display the previous and the updated versions of the record.
-
-        :param date_prev: A previous date
-        :param cat_prev: A previous transaction category
-        :param amt_prev: A previous amount of money
-        :param cat_new: A new transaction category
-        :param amt_new: A new amount of money
-        :param desc_prev: A previous description, default to ""
-        :param desc_new: A new description, default to ""
-        """
-
-        if (
-                not date_prev
-                or not cat_prev
-                or not amt_prev
-                or not cat_new
-                or not amt_new
-        ):
-            print("You need to add all the required arguments to update the note", end="\n\n")
-            return
-
-        db_data, notes_amt = self.get_db_data_and_notes_amt()
-
-        if notes_amt == 0:
-            print("Can't update the note(-s) because of the empty database", end="\n\n")
-            return
-
-        if not self.check_date(date=date_prev):
-            return
-
-        if amt_prev < 0 or amt_new < 0:
-            print("The amount of money must be a positive number", end="\n\n")
-            return
-
-        cat_prev, amt_prev, desc_prev = self.prepare_cat_amt_desc(cat=cat_prev, amt=amt_prev, desc=desc_prev)
-        cat_new, amt_new, desc_new = self.prepare_cat_amt_desc(cat=cat_new, amt=amt_new, desc=desc_new)
-
-        note_found, note_found_index = self.filter_records(
-            db_data=db_data,
-            date=date_prev,
-            cat=cat_prev,
-            amt=amt_prev,
-            desc=desc_prev,
-            action="update"
-        )
-
-        if note_found:
-            note_new = self.create_note_template(cat=cat_new, amt=amt_new, desc=desc_new)
-            db_data["notes"][note_found_index] = note_new
-            self.update_db(db_data=db_data)
-
-            print("The update finished successfully!", end="\n\n")
-            print("-" * 40)
-            print("Before the update:")
-            print("-" * 40)
-            self.print_notes(notes_lst=[note_found])
-            print("-" * 40)
-            print("After the update:")
-            print("-" * 40)
-            self.print_notes(notes_lst=[note_new])
-            self.create_or_update_text_document(action_text="update")
-
-    def delete_note(
-            self,
-            date: str,
-            cat: Literal["1", "2"],
-            amt: float,
-            desc: Union[list, Literal[""]]
-    ) -> None:
-        """
-        Delete a record from the database.
-        Display the deleted record.
-
-        :param date: Record date
-        :param cat: Record transaction category
-        :param amt: Record amount of money
-        :param desc: Record description, defaults to ""
-        """
-
-        if not date or not cat or not amt:
-            print("You need to add all the required arguments to delete the note", end="\n\n")
-            return
-
-        db_data, notes_amt = self.get_db_data_and_notes_amt()
-
-        if notes_amt == 0:
-            print("Can't delete the note(-s) because of the empty database", end="\n\n")
-            return
-
-        if not self.check_date(date=date):
-            return
-
-        if amt < 0:
-            print("The amount of money must be a positive number", end="\n\n")
-            return
-
-        cat, amt, desc = self.prepare_cat_amt_desc(cat, amt, desc)
-
-        note_found = self.filter_records(
-            db_data=db_data,
-            date=date,
-            cat=cat,
-            amt=amt,
-            desc=desc,
-            action="delete"
-        )
-
-        if note_found:
-            note_deleted, note_deleted_index = note_found[0], note_found[1]
-            del db_data["notes"][note_deleted_index]
-            self.update_db(db_data=db_data)
-
-            print("The note has been deleted successfully!", end="\n\n")
-            print("-" * 40)
-            print("Deleted note:")
-            print("-" * 40)
-            self.print_notes(notes_lst=[note_deleted])
-
-            notes_amt = self.get_db_data_and_notes_amt()[1]
-            if notes_amt == 0:
-                print("*" * 40)
-                print("Database is empty!")
-                self.delete_text_document()
-            else:
-                self.create_or_update_text_document(action_text="update")
-
-    def find_notes(
-            self,
-            date: Union[str, None],
-            cat: Union[Literal["1", "2"], None],
-            amt: Union[float, None]
-    ) -> None:
-        """
-        Find the record(-s) from the database by the next parameters.
-        Display the found record(-s).
-
-        :param date: Record date
-        :param cat: Record transaction category
-        :param amt: Record amount of money
-        """
-
-        if not date and not cat and not amt:
-            print("You need to add at least one required argument to filter the notes", end="\n\n")
-            return
-
-        db_data, notes_amt = self.get_db_data_and_notes_amt()
-
-        if notes_amt == 0:
-            print("Can't find the note(-s) because of the empty database", end="\n\n")
-            return
-
-        note_found = []
-        is_multiple_search = False
-
-        if date:
-            if not self.check_date(date=date):
-                return
-
-            note_found = [note for note in db_data["notes"] if note[0]["date"] == date]
-            is_multiple_search = True
-
-        if cat:
-            cat = "waste" if cat == "1" else "income"
-
-            if is_multiple_search:
-                note_found = [note for note in note_found if note[1]["category"] == cat]
-                is_multiple_search = True
-            else:
-                note_found = [note for note in db_data["notes"] if note[1]["category"] == cat]
-                is_multiple_search = True
-
-        if amt:
-            if amt < 0:
-                print("The amount of money must be a positive number", end="\n\n")
-                return
-
-            if is_multiple_search:
-                note_found = [note for note in note_found if abs(note[2]["amount"]) == amt]
-            else:
-                note_found = [note for note in db_data["notes"] if abs(note[2]["amount"]) == amt]
-
-        if note_found:
-            print("-" * 30)
-            print("Search result:")
-            print("-" * 30, end="\n\n")
-            self.print_notes(notes_lst=note_found)
-        else:
-            print("No matches in your search", end="\n\n")
-
-    def show_balance(self) -> None:
-        """Display current amount of money."""
-
-        print("-" * 40)
-        print("Your current balance is: {balance:.2f}".format(balance=self.__balance))
-        print("-" * 40, end="\n\n")
-
-    def clear_notes(self) -> None:
-        """
-        Delete all records in the database.
-        Remove "db.txt" text file.
-        """
-
-        self.add_initial_template_in_db()
-        print("The notes history has been cleaned!", end="\n\n")
-        self.delete_text_document()
-
-    # DRY Methods
-    def check_db_existing_or_crete_db_template(self) -> None:
-        """
-        Check if the database exists.
-        If the database doesn't exist - create 'db.json' with the initial template.
-        """
-
-        try:
-            open("db.json")
-        except FileNotFoundError:
-            self.add_initial_template_in_db()
-            print("*" * 50)
-            print("Database has been created!")
-            print("*" * 50, end="\n\n")
-
-    def get_db_data_and_notes_amt(self) -> tuple[dict, int]:
-        """
-        Read JSON file and deserialize a data.
-        Return total amount of notes.
-
-        :return: A tuple which contains a serialized database data and amount of notes
-        """
-
-        self.check_db_existing_or_crete_db_template()
-
-        with open("db.json", "r") as file:
-            db_data = json.load(file)
-        notes_amt = len(db_data["notes"])
-
-        return db_data, notes_amt
-
-    def get_current_balance(self) -> float:
-        """Return current amount of money"""
-
-        db_data, notes_amt = self.get_db_data_and_notes_amt()
-
-        if notes_amt > 0:
-            balance = sum(
-                [
-                    val
-                    for note in db_data["notes"]
-                    for line in note
-                    for key, val in line.items()
-                    if key == "amount"
-                ]
-            )
-            return round(balance, 2)
-        return 0.0
-
-    def add_initial_template_in_db(self) -> None:
-        """Add the initial template in the database."""
-
-        initial_template = {"notes": []}
-        self.update_db(db_data=initial_template)
-
-    @staticmethod
-    def update_db(db_data) -> None:
-        """Update the database with a current data."""
-
-        with open("db.json", "w") as file:
-            json.dump(obj=db_data, fp=file, indent=4)
-
-    @staticmethod
-    def create_note_template(
-            cat: Literal["waste", "income"],
-            amt: float,
-            desc: str
-    ) -> list[dict[str, Union[str, float]]]:
-        """
-        Create a list with the record columns and their values.
-
-        :param cat: Record transaction category
-        :param amt: Record amount of money
-        :param desc: Record description
-        :return: Note template
-        """
-
-        date_current = str(datetime.date.today())
-        template = [
-            {"date": date_current},
-            {"category": cat},
-            {"amount": amt},
-            {"description": desc},
-        ]
-        return template
-
-    def create_or_update_text_document(self, action_text: Literal["create", "update"] = None) -> None:
-        """Create or update 'db.txt', which contains all records from the database."""
-
-        db_data, notes_amt = self.get_db_data_and_notes_amt()
-
-        if notes_amt == 0:
-            print("Can't create 'db.txt' because of the empty database", end="\n\n")
-            return
-
-        note_lines_lst = self.prepare_notes_to_text(notes_lst=db_data["notes"])
-
-        with open("db.txt", "w", encoding="utf-8") as file:
-            for line in note_lines_lst:
-                if line.startswith("Description"):
-                    file.write("".join([line, "\n\n"]))
-                else:
-                    file.write("".join([line, "\n"]))
-
-            file.write("".join([("-" * 30), "\n"]))
-            self.__balance = self.get_current_balance()
-            file.write("".join(["Current balance is: {balance:.2f}".format(balance=self.__balance), "\n"]))
-
-        if action_text:
-            print("*" * 40)
-            print(f'File "db.txt" has been {action_text}d!')
-            print("*" * 40, end="\n\n")
-
-    @staticmethod
-    def delete_text_document() -> None:
-        """Delete text file 'db.txt'."""
-
-        try:
-            os.remove("db.txt")
-        except FileNotFoundError:
-            pass
-        else:
-            print("*" * 40)
-            print('File "db.txt" has been deleted!')
-            print("*" * 40, end="\n\n")
-
-    def print_notes(self, notes_lst: list) -> None:
-        """
-        Display note(-s).
-
-        :param notes_lst: A list with the note(-s)
-        """
-
-        note_lines_lst = self.prepare_notes_to_text(notes_lst=notes_lst)
-
-        for line in note_lines_lst:
-            if line.startswith("Description"):
-                print(line, end="\n\n")
-            else:
-                print(line)
-
-    @staticmethod
-    def check_date(date: str) -> bool:
-        """
-        Check a value of an argument [--data] from the CLI.
-
-        :param date: Record date
-        :return: Result of check
-        """
-
-        try:
-            datetime.date.fromisoformat(date)
-            return True
-        except ValueError as error:
-            print(error, end="\n\n")
-            return False
-
-    @staticmethod
-    def prepare_cat_amt_desc(
-            cat: Literal["1", "2"],
-            amt: float,
-            desc: Union[list, Literal[""]]
-    ) -> tuple:
-        """
-        Change category value to a string view.
-        If the description was sent - change the description type from list to str.
-
-        :param cat: Record transaction category
-        :param amt: Record amount of money
-        :param desc: Record description
-        :return: Return a tuple (cat, amt, desc) after transformation
-        """
-
-        if cat == "1":
-            amt = -amt
-            cat = "waste"
-        else:
-            cat = "income"
-
-        if desc:
-            desc = " ".join(desc)
-
-        return cat, amt, desc
-
-    @staticmethod
-    def filter_records(
-            db_data: dict,
-            date: str,
-            cat: Literal["waste", "income"],
-            amt: float,
-            desc: str,
-            action: str
-    ) -> Union[tuple[list, int], None]:
-        """
-        Filter records by parameters.
-
-        :param db_data: A dict with the records
-        :param date: Record date
-        :param cat: Record transaction category
-        :param amt: Record amount of money
-        :param desc: Record description
-        :param action: "update" | "delete"
-        :return: A Matching record, and its index | None
-        """
-
-        data_filtered = [note for note in db_data["notes"] if note[0]["date"] == date]
-        if not data_filtered:
-            print(f'No matches with previous date "{date}" to {action}', end="\n\n")
-            return
-
-        data_filtered = [note for note in data_filtered if note[1]["category"] == cat]
-        if not data_filtered:
-            print(f'No matches with category "{cat}" to {action}', end="\n\n")
-            return
-
-        data_filtered = [note for note in data_filtered if note[2]["amount"] == amt]
-        if not data_filtered:
-            print(f'No matches with amount "{amt}" to {action}', end="\n\n")
-            return
-
-        data_filtered = [note for note in data_filtered if note[3]["description"] == desc]
-        if not data_filtered:
-            if not desc:
-                print(f'No matches with the empty description to {action}')
-            else:
-                print(f'No matches with the description "{desc}" to {action}')
-            return
-
-        if data_filtered:
-            note_found = data_filtered[0]
-            note_found_index = db_data["notes"].index(note_found)
-            return note_found, note_found_index
-
-    @staticmethod
-    def prepare_notes_to_text(notes_lst: list) -> list[str]:
-        """
-        Transform record content to 'str' type.
-
-        :param notes_lst: A list with the notes from the database
-        :return: A list witch contains note columns and their values in 'str' type
-        """
-
-        note_lines_lst = [
-            f"{list(line.keys())[0].capitalize()}: {list(line.values())[0]}"
-            for note in notes_lst
-            for line in note
-        ]
-
-        return note_lines_lst
+import atexit
+import bisect
+import datetime
+import functools
+import io
+import json
+import math
+import os
+import re
+import sys
+import time
+from typing import Union, Literal
+
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+DATE_TODAY = str(datetime.date.today())
+DATE_TODAY_TTL = 30
+DATE_TODAY_REFRESHED_AT = time.monotonic()
+BATCH_FLUSH_EVERY = 100
+WAL_COMPACT_AFTER = 1000
+NOTE_COLUMNS = (
+    ("date", "Date"),
+    ("category", "Category"),
+    ("amount", "Amount"),
+    ("description", "Description"),
+)
+SEP30 = "-" * 30
+SEP40 = "-" * 40
+STAR40 = "*" * 40
+STAR50 = "*" * 50
+
+
+def print_banner(title: str, sep: str = SEP40, end: str = "\n") -> None:
+    """
+    Display a title between two separator lines with a single print
+    (one buffer write instead of three).
+
+    :param title: Banner title
+    :param sep: Separator line, defaults to SEP40
+    :param end: Trailing end, defaults to a newline
+    """
+
+    print(f"{sep}\n{title}\n{sep}", end=end)
+
+
+def today_str() -> str:
+    """
+    Return today's date as an ISO string.
+    The cached value is recomputed at most every DATE_TODAY_TTL seconds,
+    so the single-command runs pay for one date construction per process
+    while a long-lived batch session still notices the date change.
+    """
+
+    global DATE_TODAY, DATE_TODAY_REFRESHED_AT
+
+    now = time.monotonic()
+    if now - DATE_TODAY_REFRESHED_AT > DATE_TODAY_TTL:
+        DATE_TODAY = str(datetime.date.today())
+        DATE_TODAY_REFRESHED_AT = now
+    return DATE_TODAY
+
+
+def to_cents(amount: float) -> int:
+    """
+    Convert an amount of money to the integer cents.
+    Equality on the integer cents is hash-safe (usable as an index key)
+    and free from the float representation surprises like 0.1 + 0.2.
+
+    :param amount: Amount of money
+    :return: Amount in cents
+    """
+
+    return int(round(amount * 100))
+
+
+@functools.lru_cache(maxsize=256)
+def validate_date(date: str) -> Union[str, None]:
+    """
+    Return the error message for an invalid ISO date (None when the date is valid).
+    A malformed value is rejected by the compiled pattern without the cost
+    of raising an exception; 'fromisoformat' stays only for the semantic
+    check (month and day ranges). The results are memoized - the same
+    dates repeat across the commands of a session.
+
+    :param date: Record date
+    :return: An error message | None
+    """
+
+    if not DATE_PATTERN.fullmatch(date):
+        return f"Invalid isoformat string: {date!r}"
+
+    try:
+        datetime.date.fromisoformat(date)
+        return None
+    except ValueError as error:
+        return str(error)
+
+
+def buffered_output(command):
+    """
+    Collect all the prints of a command into an in-memory buffer
+    and write them to stdout with a single call at the end,
+    instead of one stdio write (and flush) per print.
+    """
+
+    @functools.wraps(command)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        stdout = sys.stdout
+        sys.stdout = buffer
+        try:
+            return command(*args, **kwargs)
+        finally:
+            sys.stdout = stdout
+            stdout.write(buffer.getvalue())
+
+    return wrapper
+
+
+class NoteManager:
+    """
+    View for the CLI Note Manager.
+    Provide CRUD commands, and several addition functions:
+        - Find the record(-s) from the database by the parameters;
+        - Display current amount of money;
+        - Delete all the records from the database;
+        - Create or update on demand a text file 'db.txt' with all records from the database.
+    """
+
+    def __init__(self, autoflush: bool = True):
+        self.__autoflush = autoflush
+        self.__pending_ops = 0
+        self.__db_data = None
+        self.__db_mtime = None
+        self.__dirty = False
+        self.__pending_log = []
+        self.__db_log_lines = 0
+        self.__log_fd = None
+        atexit.register(self.close_log_fd)
+        self.__idx = {}
+        self.__idx_by_date = {}
+        self.__idx_by_cat = {}
+        self.__idx_by_amt = {}
+        self.__dates_sorted = []
+        self.__dates_order = []
+        self.__db_version = 0
+        self.__notes_text_cache = []
+        self.__notes_text_version = -1
+        self.__txt_version = -1
+        self.__balance = 0.0
+        self.get_db_data_and_notes_amt()
+
+        if not self.__autoflush:
+            atexit.register(self.flush_db, force=True)
+
+    @buffered_output
+    def create_note(
+            self,
+            cat: Literal["1", "2"],
+            amt: float,
+            desc: Union[list, Literal[""]]
+    ) -> None:
+        """
+        Create a new record in the database.
+        Display a new record.
+
+        :param cat: Record transaction category
+        :param amt: Record amount of money
+        :param desc: Record description, defaults to ""
+        """
+
+        if not cat or not amt:
+            print("You need to add all the required arguments to create a note", end="\n\n")
+            return
+
+        if amt < 0:
+            print("The amount of money must be a positive number", end="\n\n")
+            return
+
+        db_data = self.get_db_data_and_notes_amt()[0]
+        cat, amt, desc = self.prepare_cat_amt_desc(cat=cat, amt=amt, desc=desc)
+        note_new = self.create_note_template(cat=cat, amt=amt, desc=desc)
+        db_data["notes"].append(note_new)
+        self.__pending_log.append({"op": "add", "note": note_new})
+        self.__balance += amt
+        self.__dirty = True
+
+        print("The new note has been created!", end="\n\n")
+        print_banner("Created note:")
+        self.print_notes(notes_lst=[note_new])
+        self.flush_db()
+
+    @buffered_output
+    def read_notes(self) -> None:
+        """Display all the records from the database."""
+
+        db_data, notes_amt = self.get_db_data_and_notes_amt()
+
+        if notes_amt > 0:
+            print_banner(f"Database contains {notes_amt} note(-s):", end="\n\n")
+            self.print_notes(notes_lst=db_data["notes"])
+        else:
+            print("Can't show all notes because of the empty database", end="\n\n")
+
+    @buffered_output
+    def update_note(
+            self,
+            date_prev: str,
+            cat_prev: Literal["1", "2"],
+            amt_prev: float,
+            desc_prev: Union[list, Literal[""]],
+            cat_new: Literal["1", "2"],
+            amt_new: float,
+            desc_new: Union[list, Literal[""]]
+    ) -> None:
+        """
+        Update an existing record with the new one and write it into the database.
+        Display the previous and the updated versions of the record.
+
+        :param date_prev: A previous date
+        :param cat_prev: A previous transaction category
+        :param amt_prev: A previous amount of money
+        :param cat_new: A new transaction category
+        :param amt_new: A new amount of money
+        :param desc_prev: A previous description, default to ""
+        :param desc_new: A new description, default to ""
+        """
+
+        if (
+                not date_prev
+                or not cat_prev
+                or not amt_prev
+                or not cat_new
+                or not amt_new
+        ):
+            print("You need to add all the required arguments to update the note", end="\n\n")
+            return
+
+        db_data, notes_amt = self.get_db_data_and_notes_amt()
+
+        if notes_amt == 0:
+            print("Can't update the note(-s) because of the empty database", end="\n\n")
+            return
+
+        if not self.check_date(date=date_prev):
+            return
+
+        if amt_prev < 0 or amt_new < 0:
+            print("The amount of money must be a positive number", end="\n\n")
+            return
+
+        cat_prev, amt_prev, desc_prev = self.prepare_cat_amt_desc(cat=cat_prev, amt=amt_prev, desc=desc_prev)
+        cat_new, amt_new, desc_new = self.prepare_cat_amt_desc(cat=cat_new, amt=amt_new, desc=desc_new)
+
+        note_found = self.filter_records(
+            db_data=db_data,
+            date=date_prev,
+            cat=cat_prev,
+            amt=amt_prev,
+            desc=desc_prev,
+            action="update"
+        )
+
+        if note_found:
+            note_found, note_found_index = note_found[0], note_found[1]
+            note_new = self.create_note_template(cat=cat_new, amt=amt_new, desc=desc_new)
+            db_data["notes"][note_found_index] = note_new
+            self.__pending_log.append({"op": "set", "index": note_found_index, "note": note_new})
+            self.__balance += amt_new - amt_prev
+            self.__dirty = True
+
+            print("The update finished successfully!", end="\n\n")
+            print_banner("Before the update:")
+            self.print_notes(notes_lst=[note_found])
+            print_banner("After the update:")
+            self.print_notes(notes_lst=[note_new])
+            self.flush_db()
+
+    @buffered_output
+    def delete_note(
+            self,
+            date: str,
+            cat: Literal["1", "2"],
+            amt: float,
+            desc: Union[list, Literal[""]]
+    ) -> None:
+        """
+        Delete a record from the database.
+        Display the deleted record.
+
+        :param date: Record date
+        :param cat: Record transaction category
+        :param amt: Record amount of money
+        :param desc: Record description, defaults to ""
+        """
+
+        if not date or not cat or not amt:
+            print("You need to add all the required arguments to delete the note", end="\n\n")
+            return
+
+        db_data, notes_amt = self.get_db_data_and_notes_amt()
+
+        if notes_amt == 0:
+            print("Can't delete the note(-s) because of the empty database", end="\n\n")
+            return
+
+        if not self.check_date(date=date):
+            return
+
+        if amt < 0:
+            print("The amount of money must be a positive number", end="\n\n")
+            return
+
+        cat, amt, desc = self.prepare_cat_amt_desc(cat, amt, desc)
+
+        note_found = self.filter_records(
+            db_data=db_data,
+            date=date,
+            cat=cat,
+            amt=amt,
+            desc=desc,
+            action="delete"
+        )
+
+        if note_found:
+            note_deleted, note_deleted_index = note_found[0], note_found[1]
+            del db_data["notes"][note_deleted_index]
+            self.__pending_log.append({"op": "del", "index": note_deleted_index})
+            self.__balance -= note_deleted["amount"]
+            self.__dirty = True
+
+            print("The note has been deleted successfully!", end="\n\n")
+            print_banner("Deleted note:")
+            self.print_notes(notes_lst=[note_deleted])
+
+            if not db_data["notes"]:
+                print(f"{STAR40}\nDatabase is empty!")
+            self.flush_db()
+
+    @buffered_output
+    def find_notes(
+            self,
+            date: Union[str, None],
+            cat: Union[Literal["1", "2"], None],
+            amt: Union[float, None]
+    ) -> None:
+        """
+        Find the record(-s) from the database by the next parameters.
+        Display the found record(-s).
+
+        :param date: Record date
+        :param cat: Record transaction category
+        :param amt: Record amount of money
+        """
+
+        if not date and not cat and not amt:
+            print("You need to add at least one required argument to filter the notes", end="\n\n")
+            return
+
+        db_data, notes_amt = self.get_db_data_and_notes_amt()
+
+        if notes_amt == 0:
+            print("Can't find the note(-s) because of the empty database", end="\n\n")
+            return
+
+        matched_indexes = None
+
+        if date:
+            if not self.check_date(date=date):
+                return
+
+            date_lo = bisect.bisect_left(self.__dates_sorted, date)
+            date_hi = bisect.bisect_right(self.__dates_sorted, date)
+            matched_indexes = set(self.__dates_order[date_lo:date_hi])
+
+        if cat:
+            cat = "waste" if cat == "1" else "income"
+            cat_indexes = self.__idx_by_cat.get(cat, set())
+            matched_indexes = cat_indexes if matched_indexes is None else matched_indexes & cat_indexes
+
+        if amt:
+            if amt < 0:
+                print("The amount of money must be a positive number", end="\n\n")
+                return
+
+            amt_indexes = self.__idx_by_amt.get(to_cents(amt), set())
+            matched_indexes = amt_indexes if matched_indexes is None else matched_indexes & amt_indexes
+
+        note_found = [db_data["notes"][note_index] for note_index in sorted(matched_indexes)]
+
+        if note_found:
+            print_banner("Search result:", sep=SEP30, end="\n\n")
+            self.print_notes(notes_lst=note_found)
+        else:
+            print("No matches in your search", end="\n\n")
+
+    @buffered_output
+    def show_balance(self) -> None:
+        """Display current amount of money."""
+
+        print_banner(f"Your current balance is: {self.__balance:.2f}", end="\n\n")
+
+    @buffered_output
+    def clear_notes(self) -> None:
+        """
+        Delete all records in the database.
+        Remove "db.txt" text file.
+        """
+
+        db_data = self.get_db_data_and_notes_amt()[0]
+        db_data["notes"].clear()
+        self.__pending_log.append({"op": "clear"})
+        self.__balance = 0.0
+        self.__dirty = True
+        print("The notes history has been cleaned!", end="\n\n")
+        self.flush_db()
+
+    @buffered_output
+    def sync_text_document(self) -> None:
+        """
+        Create or update 'db.txt' with all the records from the database.
+        The text document is generated only on demand (the [-sync] CLI flag),
+        so the mutating commands don't pay for its full rewrite any more.
+        """
+
+        action_text = "update" if os.path.exists("db.txt") else "create"
+        self.create_or_update_text_document(action_text=action_text)
+
+    # DRY Methods
+    def check_db_existing_or_crete_db_template(self) -> None:
+        """
+        Check if the database exists.
+        If the database doesn't exist - create 'db.json' with the initial template.
+        """
+
+        if not os.path.exists("db.json"):
+            self.add_initial_template_in_db()
+            print_banner("Database has been created!", sep=STAR50, end="\n\n")
+
+    def get_db_data_and_notes_amt(self) -> tuple[dict, int]:
+        """
+        Return a deserialized database data and total amount of notes.
+        The data is cached in memory after the first read:
+        'db.json' is re-read and re-parsed only when the file was changed from the outside.
+
+        :return: A tuple which contains a deserialized database data and amount of notes
+        """
+
+        self.check_db_existing_or_crete_db_template()
+
+        db_mtime = self.get_db_files_mtime()
+        if self.__db_data is None or (db_mtime != self.__db_mtime and not self.__dirty):
+            with open("db.json", "rb") as file:
+                self.__db_data = json.loads(file.read())
+            self.__db_mtime = db_mtime
+            self.__db_version += 1
+            self.migrate_notes_to_flat_view()
+            self.replay_db_log()
+            self.rebuild_notes_indexes()
+            self.__balance = math.fsum(note["amount"] for note in self.__db_data["notes"])
+        notes_amt = len(self.__db_data["notes"])
+
+        return self.__db_data, notes_amt
+
+    @staticmethod
+    def get_db_files_mtime() -> tuple[int, Union[int, None]]:
+        """
+        Return the modification times (in nanoseconds, so the same-second
+        external changes are detected too) of the 'db.json' snapshot
+        and the 'db.log' operations log (None if there is no log).
+        """
+
+        log_mtime = os.stat("db.log").st_mtime_ns if os.path.exists("db.log") else None
+        return os.stat("db.json").st_mtime_ns, log_mtime
+
+    def replay_db_log(self) -> None:
+        """
+        Replay the append-only operations log 'db.log' onto the 'db.json'
+        snapshot. Every mutation is one JSON line in the log, so a single-row
+        change costs O(1) bytes written instead of a full database rewrite.
+        A torn final line (a crash or kill mid-append) is truncated away
+        instead of failing every start-up; a valid final line which lost
+        only its newline gets the newline back, so the future appends
+        can't glue onto it.
+        """
+
+        self.__db_log_lines = 0
+        if not os.path.exists("db.log"):
+            return
+
+        notes_lst = self.__db_data["notes"]
+        with open("db.log", "rb") as file:
+            log_lines = file.readlines()
+
+        valid_bytes = 0
+        for line_index, line in enumerate(log_lines):
+            try:
+                operation = json.loads(line)
+            except json.JSONDecodeError:
+                if line_index == len(log_lines) - 1:
+                    os.truncate("db.log", valid_bytes)
+                    self.__db_mtime = self.get_db_files_mtime()
+                    break
+                raise
+
+            if operation["op"] == "add":
+                notes_lst.append(operation["note"])
+            elif operation["op"] == "set":
+                notes_lst[operation["index"]] = operation["note"]
+            elif operation["op"] == "del":
+                del notes_lst[operation["index"]]
+            elif operation["op"] == "clear":
+                notes_lst.clear()
+            valid_bytes += len(line)
+            self.__db_log_lines += 1
+        else:
+            if log_lines and not log_lines[-1].endswith(b"\n"):
+                with open("db.log", "ab") as file:
+                    file.write(b"\n")
+                self.__db_mtime = self.get_db_files_mtime()
+
+    def rebuild_notes_indexes(self) -> None:
+        """
+        Rebuild the lookup indexes for the notes:
+        a composite (date, category, amount) index for filter_records,
+        the partial indexes by date / category / amount for find_notes,
+        and a sorted view of the dates for the binary search by date
+        (ready for the date-range search in the next version of this app).
+        With one hash probe instead of a linear scan over all the notes.
+        """
+
+        self.__idx = {}
+        self.__idx_by_date = {}
+        self.__idx_by_cat = {}
+        self.__idx_by_amt = {}
+
+        for note_index, note in enumerate(self.__db_data["notes"]):
+            composite_key = (note["date"], note["category"], to_cents(note["amount"]))
+            self.__idx.setdefault(composite_key, []).append(note_index)
+            self.__idx_by_date.setdefault(note["date"], set()).add(note_index)
+            self.__idx_by_cat.setdefault(note["category"], set()).add(note_index)
+            self.__idx_by_amt.setdefault(abs(to_cents(note["amount"])), set()).add(note_index)
+
+        notes_lst = self.__db_data["notes"]
+        self.__dates_order = sorted(range(len(notes_lst)), key=lambda note_index: notes_lst[note_index]["date"])
+        self.__dates_sorted = [notes_lst[note_index]["date"] for note_index in self.__dates_order]
+
+    def migrate_notes_to_flat_view(self) -> None:
+        """
+        Flatten the legacy note view (a list with 4 single-key dicts)
+        to a flat dict with all the note columns.
+        The database is rewritten once with the flat view.
+        """
+
+        notes_lst = self.__db_data["notes"]
+        if notes_lst and isinstance(notes_lst[0], list):
+            self.__db_data["notes"] = [
+                {key: val for line in note for key, val in line.items()}
+                for note in notes_lst
+            ]
+            self.update_db(db_data=self.__db_data)
+
+    def add_initial_template_in_db(self) -> None:
+        """Add the initial template in the database."""
+
+        initial_template = {"notes": []}
+        self.update_db(db_data=initial_template)
+
+    def update_db(self, db_data) -> None:
+        """
+        Update the database with a current data and refresh the in-memory cache.
+        The JSON is written compact (no indent) - it halves the bytes on disk,
+        and the human-readable view lives in 'db.txt' anyway.
+        The write goes to a temporary file first and lands with an atomic
+        rename, so a crash mid-write can never leave a torn 'db.json'.
+        """
+
+        with open("db.json.tmp", "w") as file:
+            json.dump(obj=db_data, fp=file, separators=(",", ":"))
+        os.replace("db.json.tmp", "db.json")
+        self.__db_data = db_data
+        self.__db_mtime = self.get_db_files_mtime()
+
+    def flush_db(self, force: bool = False) -> None:
+        """
+        Flush the in-memory mutations to disk.
+        Mutating commands only change the data in memory, mark it as dirty
+        and record their operations, so the file writes happen once per
+        command in this single place. The operations are appended to the
+        'db.log' operations log - O(1) bytes per mutation; the full 'db.json'
+        snapshot is rewritten (compacted) only when the log outgrows
+        WAL_COMPACT_AFTER lines or the database became empty.
+        An empty database also drops a stale 'db.txt'.
+        Without the autoflush (the batch mode) the file writes are deferred
+        and happen every BATCH_FLUSH_EVERY mutations or at the process exit.
+
+        :param force: Write the files even in the batch mode, defaults to False
+        """
+
+        if not self.__dirty:
+            return
+
+        self.__db_version += 1
+        self.rebuild_notes_indexes()
+
+        if not self.__autoflush and not force:
+            self.__pending_ops += 1
+            if self.__pending_ops < BATCH_FLUSH_EVERY:
+                return
+
+        self.__pending_ops = 0
+
+        if (
+                self.__db_log_lines + len(self.__pending_log) > WAL_COMPACT_AFTER
+                or not self.__db_data["notes"]
+        ):
+            self.compact_db_log()
+        else:
+            log_blob = "".join(
+                json.dumps(operation, separators=(",", ":")) + "\n"
+                for operation in self.__pending_log
+            ).encode("utf-8")
+            log_fd = self.get_log_fd()
+            written = os.write(log_fd, log_blob)
+            while written < len(log_blob):
+                written += os.write(log_fd, log_blob[written:])
+            self.__db_log_lines += len(self.__pending_log)
+            self.__db_mtime = self.get_db_files_mtime()
+
+        self.__pending_log.clear()
+        self.__dirty = False
+
+        if not self.__db_data["notes"]:
+            self.delete_text_document()
+
+    def compact_db_log(self) -> None:
+        """
+        Rewrite the full 'db.json' snapshot from the in-memory data
+        and truncate the 'db.log' operations log.
+        """
+
+        self.close_log_fd()
+        if os.path.exists("db.log"):
+            os.remove("db.log")
+        self.__db_log_lines = 0
+        self.update_db(db_data=self.__db_data)
+
+    def get_log_fd(self) -> int:
+        """
+        Return the always-open append descriptor of 'db.log'.
+        The descriptor is opened once per process and closed at the exit,
+        so the hot append path pays no open/close syscalls per flush.
+        """
+
+        if self.__log_fd is None:
+            self.__log_fd = os.open("db.log", os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return self.__log_fd
+
+    def close_log_fd(self) -> None:
+        """Close the append descriptor of 'db.log' if it was opened."""
+
+        if self.__log_fd is not None:
+            os.close(self.__log_fd)
+            self.__log_fd = None
+
+    @staticmethod
+    def create_note_template(
+            cat: Literal["waste", "income"],
+            amt: float,
+            desc: str
+    ) -> dict[str, Union[str, float]]:
+        """
+        Create a dict with the record columns and their values.
+
+        :param cat: Record transaction category
+        :param amt: Record amount of money
+        :param desc: Record description
+        :return: Note template
+        """
+
+        template = {
+            "date": today_str(),
+            "category": cat,
+            "amount": amt,
+            "description": desc,
+        }
+        return template
+
+    def create_or_update_text_document(self, action_text: Literal["create", "update"] = None) -> None:
+        """
+        Create or update 'db.txt', which contains all records from the database.
+        The rewrite is skipped when the database revision didn't change
+        since the last generated text document.
+        """
+
+        db_data, notes_amt = self.get_db_data_and_notes_amt()
+
+        if notes_amt == 0:
+            print("Can't create 'db.txt' because of the empty database", end="\n\n")
+            return
+
+        if self.__txt_version == self.__db_version and os.path.exists("db.txt"):
+            print_banner('File "db.txt" is already up to date!', sep=STAR40, end="\n\n")
+            return
+
+        note_lines_lst = self.prepare_notes_to_text(notes_lst=db_data["notes"])
+
+        out_lines = [
+            line + ("\n\n" if line.startswith("Description") else "\n")
+            for line in note_lines_lst
+        ]
+        out_lines.append(SEP30 + "\n")
+        out_lines.append("Current balance is: {balance:.2f}\n".format(balance=self.__balance))
+
+        with open("db.txt.tmp", "w", encoding="utf-8", buffering=1 << 16) as file:
+            file.write("".join(out_lines))
+        os.replace("db.txt.tmp", "db.txt")
+        self.__txt_version = self.__db_version
+
+        if action_text:
+            print_banner(f'File "db.txt" has been {action_text}d!', sep=STAR40, end="\n\n")
+
+    @staticmethod
+    def delete_text_document() -> None:
+        """Delete text file 'db.txt'."""
+
+        try:
+            os.remove("db.txt")
+        except FileNotFoundError:
+            pass
+        else:
+            print_banner('File "db.txt" has been deleted!', sep=STAR40, end="\n\n")
+
+    def print_notes(self, notes_lst: list) -> None:
+        """
+        Display note(-s).
+
+        :param notes_lst: A list with the note(-s)
+        """
+
+        note_lines_lst = self.prepare_notes_to_text(notes_lst=notes_lst)
+
+        for line in note_lines_lst:
+            if line.startswith("Description"):
+                print(line, end="\n\n")
+            else:
+                print(line)
+
+    @staticmethod
+    def check_date(date: str) -> bool:
+        """
+        Check a value of an argument [--data] from the CLI.
+        Display the error message for an invalid date.
+
+        :param date: Record date
+        :return: Result of check
+        """
+
+        error_text = validate_date(date)
+        if error_text is None:
+            return True
+
+        print(error_text, end="\n\n")
+        return False
+
+    @staticmethod
+    def prepare_cat_amt_desc(
+            cat: Literal["1", "2"],
+            amt: float,
+            desc: Union[list, Literal[""]]
+    ) -> tuple:
+        """
+        Change category value to a string view.
+        If the description was sent - change the description type from list to str.
+
+        :param cat: Record transaction category
+        :param amt: Record amount of money
+        :param desc: Record description
+        :return: Return a tuple (cat, amt, desc) after transformation
+        """
+
+        if cat == "1":
+            amt = -amt
+            cat = "waste"
+        else:
+            cat = "income"
+
+        if desc:
+            desc = " ".join(desc)
+
+        return cat, amt, desc
+
+    def filter_records(
+            self,
+            db_data: dict,
+            date: str,
+            cat: Literal["waste", "income"],
+            amt: float,
+            desc: str,
+            action: str
+    ) -> Union[tuple[dict, int], None]:
+        """
+        Filter records by parameters with one probe in the composite index.
+        If there is no full match - the partial indexes report which
+        parameter has eliminated all the candidates.
+
+        :param db_data: A dict with the records
+        :param date: Record date
+        :param cat: Record transaction category
+        :param amt: Record amount of money
+        :param desc: Record description
+        :param action: "update" | "delete"
+        :return: A Matching record, and its index | None
+        """
+
+        candidates = self.__idx.get((date, cat, to_cents(amt)), [])
+        for note_index in candidates:
+            note = db_data["notes"][note_index]
+            if note["description"] == desc:
+                return note, note_index
+
+        if date not in self.__idx_by_date:
+            print(f'No matches with previous date "{date}" to {action}', end="\n\n")
+        elif not self.__idx_by_date[date] & self.__idx_by_cat.get(cat, set()):
+            print(f'No matches with category "{cat}" to {action}', end="\n\n")
+        elif not candidates:
+            print(f'No matches with amount "{amt}" to {action}', end="\n\n")
+        elif not desc:
+            print(f'No matches with the empty description to {action}')
+        else:
+            print(f'No matches with the description "{desc}" to {action}')
+        return
+
+    def prepare_notes_to_text(self, notes_lst: list) -> list[str]:
+        """
+        Transform record content to 'str' type.
+        The formatted lines for the whole database are memoized by the
+        database version and reused until the next mutation.
+
+        :param notes_lst: A list with the notes from the database
+        :return: A list witch contains note columns and their values in 'str' type
+        """
+
+        is_full_db = self.__db_data is not None and notes_lst is self.__db_data["notes"]
+        if is_full_db and self.__notes_text_version == self.__db_version:
+            return self.__notes_text_cache
+
+        note_lines_lst = [
+            f"{title}: {note[key]}"
+            for note in notes_lst
+            for key, title in NOTE_COLUMNS
+        ]
+
+        if is_full_db:
+            self.__notes_text_cache = note_lines_lst
+            self.__notes_text_version = self.__db_version
+
+        return note_lines_lst